@@ -9,9 +9,10 @@ import pandas as pd
 parser = argparse.ArgumentParser(description="argument parser for p4 clinet")
 
 
-parser.add_argument("mode", help="which action to take", choices=["DbToHdfs","BlockLocations","CalcAvgLoan"])
+parser.add_argument("mode", help="which action to take", choices=["DbToHdfs","BlockLocations","CalcAvgLoan","BatchCalcAvgLoan"])
 
 parser.add_argument("-c", "--code", type=int, default=0, help="county code to query average loan amount in CalcAvgLoan mode")
+parser.add_argument("--codes", type=int, nargs="+", default=[], help="county codes to query average loan amounts in BatchCalcAvgLoan mode")
 parser.add_argument("-f", "--file", type=str, default="", help="file path for BlockLocation")
 args = parser.parse_args()
 
@@ -27,6 +28,13 @@ elif args.mode == "CalcAvgLoan":
     else:
         print(resp.avg_loan)
         print(resp.source)
+elif args.mode == "BatchCalcAvgLoan":
+    resp = stub.BatchCalcAvgLoan(lender_pb2.BatchCalcAvgLoanReq(county_codes=args.codes))
+    # Averages for the counties that were found come back even when others are missing
+    if resp.avg_loans:
+        print(dict(resp.avg_loans))
+    if resp.error:
+        print(f"error: {resp.error}")
 elif args.mode == "BlockLocations":
     resp = stub.BlockLocations(lender_pb2.BlockLocationsReq(path=args.file)) 
     if resp.error:
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0clender.proto\"\x07\n\x05\x45mpty\"!\n\x11\x42lockLocationsReq\x12\x0c\n\x04path\x18\x01 \x01(\t\"\x96\x01\n\x12\x42lockLocationsResp\x12<\n\rblock_entries\x18\x01 \x03(\x0b\x32%.BlockLocationsResp.BlockEntriesEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x1a\x33\n\x11\x42lockEntriesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"%\n\x0e\x43\x61lcAvgLoanReq\x12\x13\n\x0b\x63ounty_code\x18\x01 \x01(\x05\"B\n\x0f\x43\x61lcAvgLoanResp\x12\x10\n\x08\x61vg_loan\x18\x01 \x01(\x05\x12\x0e\n\x06source\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"\x1e\n\x0cStatusString\x12\x0e\n\x06status\x18\x01 \x01(\t2\x98\x01\n\x06Lender\x12!\n\x08\x44\x62ToHdfs\x12\x06.Empty\x1a\r.StatusString\x12\x39\n\x0e\x42lockLocations\x12\x12.BlockLocationsReq\x1a\x13.BlockLocationsResp\x12\x30\n\x0b\x43\x61lcAvgLoan\x12\x0f.CalcAvgLoanReq\x1a\x10.CalcAvgLoanRespb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0clender.proto\"\x07\n\x05\x45mpty\"!\n\x11\x42lockLocationsReq\x12\x0c\n\x04path\x18\x01 \x01(\t\"\x96\x01\n\x12\x42lockLocationsResp\x12<\n\rblock_entries\x18\x01 \x03(\x0b\x32%.BlockLocationsResp.BlockEntriesEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x1a\x33\n\x11\x42lockEntriesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"%\n\x0e\x43\x61lcAvgLoanReq\x12\x13\n\x0b\x63ounty_code\x18\x01 \x01(\x05\"B\n\x0f\x43\x61lcAvgLoanResp\x12\x10\n\x08\x61vg_loan\x18\x01 \x01(\x05\x12\x0e\n\x06source\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"+\n\x13\x42\x61tchCalcAvgLoanReq\x12\x14\n\x0c\x63ounty_codes\x18\x01 \x03(\x05\"\x8e\x01\n\x14\x42\x61tchCalcAvgLoanResp\x12\x36\n\tavg_loans\x18\x01 \x03(\x0b\x32#.BatchCalcAvgLoanResp.AvgLoansEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x1a/\n\rAvgLoansEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\x1e\n\x0cStatusString\x12\x0e\n\x06status\x18\x01 \x01(\t2\xd9\x01\n\x06Lender\x12!\n\x08\x44\x62ToHdfs\x12\x06.Empty\x1a\r.StatusString\x12\x39\n\x0e\x42lockLocations\x12\x12.BlockLocationsReq\x1a\x13.BlockLocationsResp\x12\x30\n\x0b\x43\x61lcAvgLoan\x12\x0f.CalcAvgLoanReq\x1a\x10.CalcAvgLoanResp\x12?\n\x10\x42\x61tchCalcAvgLoan\x12\x14.BatchCalcAvgLoanReq\x1a\x15.BatchCalcAvgLoanRespb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,6 +33,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_BLOCKLOCATIONSRESP_BLOCKENTRIESENTRY']._loaded_options = None
   _globals['_BLOCKLOCATIONSRESP_BLOCKENTRIESENTRY']._serialized_options = b'8\001'
+  _globals['_BATCHCALCAVGLOANRESP_AVGLOANSENTRY']._loaded_options = None
+  _globals['_BATCHCALCAVGLOANRESP_AVGLOANSENTRY']._serialized_options = b'8\001'
   _globals['_EMPTY']._serialized_start=16
   _globals['_EMPTY']._serialized_end=23
   _globals['_BLOCKLOCATIONSREQ']._serialized_start=25
@@ -45,8 +47,14 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CALCAVGLOANREQ']._serialized_end=250
   _globals['_CALCAVGLOANRESP']._serialized_start=252
   _globals['_CALCAVGLOANRESP']._serialized_end=318
-  _globals['_STATUSSTRING']._serialized_start=320
-  _globals['_STATUSSTRING']._serialized_end=350
-  _globals['_LENDER']._serialized_start=353
-  _globals['_LENDER']._serialized_end=505
+  _globals['_BATCHCALCAVGLOANREQ']._serialized_start=320
+  _globals['_BATCHCALCAVGLOANREQ']._serialized_end=363
+  _globals['_BATCHCALCAVGLOANRESP']._serialized_start=366
+  _globals['_BATCHCALCAVGLOANRESP']._serialized_end=508
+  _globals['_BATCHCALCAVGLOANRESP_AVGLOANSENTRY']._serialized_start=461
+  _globals['_BATCHCALCAVGLOANRESP_AVGLOANSENTRY']._serialized_end=508
+  _globals['_STATUSSTRING']._serialized_start=510
+  _globals['_STATUSSTRING']._serialized_end=540
+  _globals['_LENDER']._serialized_start=543
+  _globals['_LENDER']._serialized_end=760
 # @@protoc_insertion_point(module_scope)
@@ -49,6 +49,11 @@ class LenderStub(object):
                 request_serializer=lender__pb2.CalcAvgLoanReq.SerializeToString,
                 response_deserializer=lender__pb2.CalcAvgLoanResp.FromString,
                 _registered_method=True)
+        self.BatchCalcAvgLoan = channel.unary_unary(
+                '/Lender/BatchCalcAvgLoan',
+                request_serializer=lender__pb2.BatchCalcAvgLoanReq.SerializeToString,
+                response_deserializer=lender__pb2.BatchCalcAvgLoanResp.FromString,
+                _registered_method=True)
 
 
 class LenderServicer(object):
@@ -75,6 +80,13 @@ class LenderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCalcAvgLoan(self, request, context):
+        """Calculate the average loan amount for several county_codes with one read of the main dataset
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_LenderServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -93,6 +105,11 @@ def add_LenderServicer_to_server(servicer, server):
                     request_deserializer=lender__pb2.CalcAvgLoanReq.FromString,
                     response_serializer=lender__pb2.CalcAvgLoanResp.SerializeToString,
             ),
+            'BatchCalcAvgLoan': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCalcAvgLoan,
+                    request_deserializer=lender__pb2.BatchCalcAvgLoanReq.FromString,
+                    response_serializer=lender__pb2.BatchCalcAvgLoanResp.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'Lender', rpc_method_handlers)
@@ -184,3 +201,30 @@ class Lender(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchCalcAvgLoan(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Lender/BatchCalcAvgLoan',
+            lender__pb2.BatchCalcAvgLoanReq.SerializeToString,
+            lender__pb2.BatchCalcAvgLoanResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
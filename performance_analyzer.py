@@ -1,27 +1,33 @@
 #!/usr/bin/env python3
 import subprocess
 import time
+import argparse
+import gc
+import statistics
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import grpc
+import lender_pb2, lender_pb2_grpc
 COUNTY_CODES = [55001, 55003, 55027, 55059, 55133]
 SERVER_CONTAINER = "p4-server-1"
+SERVER_ADDRESS = "server:5000"
+CHANNEL_POOL_SIZE = 4
+REPETITIONS = 5
 OUTPUT_DIR = "/app/outputs"
 
-def run_command(command):
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed: {command}")
-        print(f"Error: {e.stderr}")
-        raise
+# A distinct grpc.channel_id keeps each channel on its own HTTP/2 connection
+channels = [
+    grpc.insecure_channel(SERVER_ADDRESS, options=[("grpc.channel_id", i)])
+    for i in range(CHANNEL_POOL_SIZE)
+]
+stubs = [lender_pb2_grpc.LenderStub(channel) for channel in channels]
+stub_counter = itertools.count()
+
+def next_stub():
+    """Pick the next stub from the channel pool in round-robin order."""
+    return stubs[next(stub_counter) % len(stubs)]
 
 def delete_partitions():
     print("Deleting /partitions directory for a fair test...")
@@ -33,59 +39,102 @@ def delete_partitions():
     except Exception as e:
         print(f"Note: Could not delete partitions (may not exist yet): {e}")
 
+def warm_up_channels():
+    """Connect every pooled channel before timing, so no sample pays for the handshake."""
+    for channel in channels:
+        grpc.channel_ready_future(channel).result(timeout=30)
+
 def time_calc_avg_loan(county_code):
-    cmd = f"docker exec {SERVER_CONTAINER} python3 /client.py CalcAvgLoan -c {county_code}"
-    
-    start_time = time.monotonic()
-    run_command(cmd)
-    end_time = time.monotonic()
+    stub = next_stub()
+    start_ns = time.perf_counter_ns()
+    resp = stub.CalcAvgLoan(lender_pb2.CalcAvgLoanReq(county_code=county_code))
+    end_ns = time.perf_counter_ns()
     
-    elapsed = end_time - start_time
-    return elapsed
+    if resp.error:
+        raise RuntimeError(f"CalcAvgLoan failed for county {county_code}: {resp.error}")
+    elapsed = (end_ns - start_ns) / 1e9
+    return elapsed, resp.source
+
+def time_all_counties():
+    """Time one CalcAvgLoan call per county, with all counties in flight at once.
+
+    Returns {county: seconds} and {county: source reported by the server}.
+    """
+    times = {}
+    sources = {}
+    # Collect up front and keep the collector out of the timed window
+    gc.collect()
+    gc.disable()
+    try:
+        with ThreadPoolExecutor(max_workers=len(COUNTY_CODES)) as executor:
+            pending = {executor.submit(time_calc_avg_loan, c): c for c in COUNTY_CODES}
+            for future in as_completed(pending):
+                county_code = pending[future]
+                times[county_code], sources[county_code] = future.result()
+    finally:
+        gc.enable()
+    return times, sources
 
 def measure_performance():
-    create_times = []
-    reuse_times = []
-    
     print("\n" + "="*60)
     print("PERFORMANCE MEASUREMENT")
     print("="*60)
     
+    warm_up_channels()
+    create_samples = {c: [] for c in COUNTY_CODES}
+    repeat_samples = {c: [] for c in COUNTY_CODES}
+    repeat_sources = set()
+    for rep in range(REPETITIONS):
+        print(f"\nRound {rep + 1}/{REPETITIONS}")
+        # Every round starts without partitions so CREATE really creates
+        delete_partitions()
+        print("First call (CREATE) for all counties...")
+        create, _ = time_all_counties()
+        # The server answers a repeated query from its average cache while
+        # the partition is healthy, so this is not a partition re-read.
+        print("Second call (REPEAT) for all counties...")
+        repeat, sources = time_all_counties()
+        repeat_sources.update(sources.values())
+        for county_code in COUNTY_CODES:
+            create_samples[county_code].append(create[county_code])
+            repeat_samples[county_code].append(repeat[county_code])
+    
+    create_times = []
+    repeat_times = []
     for county_code in COUNTY_CODES:
-        print(f"\nTesting county {county_code}...")
-        print(f"  First call (CREATE)...", end=" ", flush=True)
-        create_time = time_calc_avg_loan(county_code)
+        create_time = statistics.median(create_samples[county_code])
+        repeat_time = statistics.median(repeat_samples[county_code])
         create_times.append(create_time)
-        print(f"{create_time:.3f}s")
-        print(f"  Second call (REUSE)...", end=" ", flush=True)
-        reuse_time = time_calc_avg_loan(county_code)
-        reuse_times.append(reuse_time)
-        print(f"{reuse_time:.3f}s")
+        repeat_times.append(repeat_time)
         
-        print(f"  Speedup: {create_time/reuse_time:.2f}x")
+        print(f"\nCounty {county_code} (median of {REPETITIONS} runs):")
+        print(f"  CREATE: {create_time:.3f}s")
+        print(f"  REPEAT: {repeat_time:.3f}s")
+        print(f"  Speedup: {create_time/repeat_time:.2f}x")
     
-    return create_times, reuse_times
+    print(f"\nREPEAT calls were served as: {', '.join(sorted(repeat_sources))}")
+    return create_times, repeat_times
 
-def calculate_averages(create_times, reuse_times):
-    """Calculate average times for create and reuse operations."""
+def calculate_averages(create_times, repeat_times):
+    """Calculate average times for create and repeat operations."""
     avg_create = sum(create_times) / len(create_times)
-    avg_reuse = sum(reuse_times) / len(reuse_times)
+    avg_repeat = sum(repeat_times) / len(repeat_times)
     
     print("\n" + "="*60)
     print("RESULTS")
     print("="*60)
     print(f"Average CREATE time: {avg_create:.3f}s")
-    print(f"Average REUSE time:  {avg_reuse:.3f}s")
-    print(f"Average Speedup:     {avg_create/avg_reuse:.2f}x")
+    print(f"Average REPEAT time: {avg_repeat:.3f}s")
+    print(f"Average Speedup:     {avg_create/avg_repeat:.2f}x")
     print("="*60 + "\n")
     
-    return avg_create, avg_reuse
+    return avg_create, avg_repeat
 
-def save_results_csv(avg_create, avg_reuse):
+def save_results_csv(avg_create, avg_repeat):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     df = pd.DataFrame({
-        'operation': ['create', 'reuse'],
-        'time': [avg_create, avg_reuse]
+        'operation': ['create', 'repeat'],
+        'time': [avg_create, avg_repeat]
     })
     csv_path = os.path.join(OUTPUT_DIR, 'performance_results.csv')
     df.to_csv(csv_path, index=False, float_format='%.3f')
@@ -93,11 +142,17 @@ def save_results_csv(avg_create, avg_reuse):
     
     return df
 
-def generate_plot(df):
+def generate_plot(df, dpi=300):
+    # Imported here so runs with --no-plot skip matplotlib startup entirely;
+    # Agg avoids initializing a GUI backend in the container.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(10, 6))
     
     # Create bar chart
-    colors = ['#e74c3c', '#2ecc71']  # Red for create, green for reuse
+    colors = ['#e74c3c', '#2ecc71']  # Red for create, green for repeat
     bars = plt.bar(df['operation'], df['time'], color=colors, alpha=0.8, edgecolor='black')
     
     # Add value labels on bars
@@ -108,32 +163,39 @@ def generate_plot(df):
                 ha='center', va='bottom', fontsize=12, fontweight='bold')
     plt.xlabel('Operation Type', fontsize=14, fontweight='bold')
     plt.ylabel('Average Time (seconds)', fontsize=14, fontweight='bold')
-    plt.title('CalcAvgLoan Performance: Create vs Reuse\nPartitioning Strategy Comparison', 
+    plt.title('CalcAvgLoan Performance: Create vs Repeat Query\nPartitioning and Caching Comparison', 
               fontsize=16, fontweight='bold', pad=20)
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     speedup = df.loc[df['operation'] == 'create', 'time'].values[0] / \
-              df.loc[df['operation'] == 'reuse', 'time'].values[0]
+              df.loc[df['operation'] == 'repeat', 'time'].values[0]
     plt.text(0.5, plt.ylim()[1] * 0.9, 
-             f'Speedup: {speedup:.2f}x faster with partitioning',
+             f'Speedup: {speedup:.2f}x faster on repeat queries',
              ha='center', fontsize=12, 
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     plt.tight_layout()
     plot_path = os.path.join(OUTPUT_DIR, 'performance_analysis.png')
-    plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+    plt.savefig(plot_path, dpi=dpi, bbox_inches='tight')
     print(f"Plot saved to {plot_path}")
     
     plt.close()
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="CalcAvgLoan performance analyzer")
+    parser.add_argument("--no-plot", action="store_true", help="skip rendering the performance plot (CSV only)")
+    parser.add_argument("--dpi", type=int, default=300, help="plot resolution; 150 is enough for iteration runs")
+    return parser.parse_args()
+
 def main():
     """Main execution function."""
+    args = parse_args()
     print("="*60)
     print("CalcAvgLoan Performance Analyzer")
     print("="*60)
-    delete_partitions()
-    create_times, reuse_times = measure_performance()
-    avg_create, avg_reuse = calculate_averages(create_times, reuse_times)
-    df = save_results_csv(avg_create, avg_reuse)
-    generate_plot(df)
+    create_times, repeat_times = measure_performance()
+    avg_create, avg_repeat = calculate_averages(create_times, repeat_times)
+    df = save_results_csv(avg_create, avg_repeat)
+    if not args.no_plot:
+        generate_plot(df, dpi=args.dpi)
     
     print("\n✓ Performance analysis complete!")
     print(f"✓ Check {OUTPUT_DIR} for results\n")